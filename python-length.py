@@ -1,9 +1,14 @@
 from __future__ import annotations
 from enum import Enum
+import functools
 import operator
 
 
+# <=, > and >= are derived from __lt__ and __eq__
+@functools.total_ordering
 class Length:
+
+    __slots__ = ("__value", "__value_m", "__unit", "__repr_cache")
     
     class UnitType(Enum):
         MILIMETER = "milimeter"
@@ -11,8 +16,11 @@ class Length:
         KILOMETER = "kilometer"
 
         @classmethod
-        def get_unit_types(cls) -> list[str]:
-            return [unit.value for unit in cls]
+        def get_unit_types(cls) -> tuple[str, ...]:
+            return cls._VALUES
+
+    # unitType values are collected once, after the enum is built (names set in its body would become members)
+    UnitType._VALUES = tuple(unit.value for unit in UnitType)
     
     # multipying factors for converting key-unit into meter-unit
     __CONVERSION_FACTOR: dict[str, float] = {
@@ -21,29 +29,47 @@ class Length:
         UnitType.KILOMETER.value: 1e3,
     }
 
+    # valid unitTypes, for constant-time membership checks
+    __UNITS: frozenset[str] = frozenset(__CONVERSION_FACTOR)
+
     # checks if input unitType is valid unitType 
     def __get_checked_input_unit(self, unit: str | UnitType | None) -> str | None:
         if not unit:
             return None
         
-        if isinstance(unit, self.UnitType):
-            unit = unit.value
+        # plain strings are the common case, anything else is narrowed down to one first
+        if unit.__class__ is not str:
+            if isinstance(unit, self.UnitType):
+                unit = unit.value
+            elif isinstance(unit, str):
+                unit = str(unit)
+            else:
+                raise ValueError("Length Unit Invalid")
 
-        if unit not in self.__units:
+        if unit not in _UNITS:
             raise ValueError("Length Unit Invalid")
         
         return unit
     
     # checks if input value is valid value 
     def __get_checked_input_value(self, value: str | float | int | None, label="Length Value") -> float:
-        try:
-            value = float(value)
-            if value < 0:
-                raise ValueError(f"{label} Negative")
-        except Exception:
-            raise ValueError(f"{label} Invalid")
-            
+        if value.__class__ is not float:
+            try:
+                value = float(value)
+            except (TypeError, ValueError, OverflowError):
+                raise ValueError(f"{label} Invalid")
+
+        if value < 0:
+            raise ValueError(f"{label} Negative")
+
         return value
+
+    # checks if input factor is valid factor, non-negative floats are returned as they are
+    def __get_checked_input_factor(self, scalar: str | float | int | None, label: str) -> float:
+        if scalar.__class__ is float and scalar >= 0:
+            return scalar
+
+        return self.__get_checked_input_value(value=scalar, label=label)
         
     def __init__(self, value: float | int | str, /, unit: str | UnitType = UnitType.METER) -> None:
         """
@@ -54,13 +80,24 @@ class Length:
         param1: (required) amount of Length
         param2: (optional) unitType of Length. By default = Length.UnitType.METER
         """
-        self.__units = self.UnitType.get_unit_types()
         unit = self.__get_checked_input_unit(unit=unit)
         value = self.__get_checked_input_value(value=value)
         
-        # mantaining value in meters for internal calculations
-        self.__value = float(value * self.__CONVERSION_FACTOR[unit])
-        self.__unit = str(unit)
+        # mantaining value in meters for internal calculations, next to the value in unitType
+        self.__value = value
+        self.__value_m = value * _CONVERSION_FACTOR[unit]
+        self.__unit = unit
+        self.__repr_cache = None
+
+    # builds a Length object from an already validated value and unitType
+    @classmethod
+    def _from_value(cls, value: float, unit: str) -> Length:
+        length = cls.__new__(cls)
+        length.__value = value
+        length.__value_m = value * _CONVERSION_FACTOR[unit]
+        length.__unit = unit
+        length.__repr_cache = None
+        return length
 
     def convert_to(self, unit: str | UnitType, /) -> None:
         """
@@ -71,130 +108,106 @@ class Length:
         param1: (required) The target unitType for conversion
         """
         unit = self.__get_checked_input_unit(unit=unit)
+        self.__value = self.__value_m / _CONVERSION_FACTOR[unit]
         self.__unit = unit
+        self.__repr_cache = None
     
     @property
     def value(self) -> float:
-        return self.__get_value_in_units(value=self.__value, unit=self.__unit)
+        return self.__value
     
     @property
     def unit(self) -> str:
         return self.__unit
     
-    # string representation of Length object
+    # string representation of Length object, cached until the Length object changes
     def __repr__(self) -> str:
-        return f"{type(self).__name__}(value={self.value},unit={self.unit})"
-    
-    # converts value into unitType from meters
-    def __get_value_in_units(self, value: float, unit: str) -> float:
-        return float(value / self.__CONVERSION_FACTOR[unit])
+        representation = self.__repr_cache
+        if representation is None:
+            representation = f"{type(self).__name__}(value={self.value},unit={self.unit})"
+            self.__repr_cache = representation
+        return representation
     
     # helper function for adding & subtracting Length values
     def __addition_subtraction_helper(
         self, self_value: float, self_unit: str, other_value: float, other_unit: str, operation
     ) -> tuple[float, str]:
         """
-        if self_unit == other_unit:
-            returns (some_value (in self_unit), self_unit)
-        else:
-            returns (some_value (in smaller_unit_type), smaller_unit_type)
+        returns (some_value (in smaller_unit_type), smaller_unit_type)
+        where smaller_unit_type is self_unit when both unitTypes are the same
         """
-        new_value, new_unit = None, None
-        self_factor = self.__CONVERSION_FACTOR[self_unit]
-        other_factor = self.__CONVERSION_FACTOR[other_unit]
-        divFactor = self_factor / other_factor
-        
-        if self_unit == other_unit:
+        self_factor = _CONVERSION_FACTOR[self_unit]
+        other_factor = _CONVERSION_FACTOR[other_unit]
+
+        # ratios between unitTypes (1, 1e3, 1e6) are exact, unlike the meter factors themselves
+        if self_factor <= other_factor:
             new_unit = self_unit
-            new_value = float(operation(self_value, other_value))
+            new_value = operation(self_value, other_value * (other_factor / self_factor))
         else:
-            # factor < 1 means self_unit < other_unit
-            new_unit = self_unit if divFactor < 1 else other_unit
-            new_value = float(operation(float(self_value * self_factor), float(other_value * other_factor)))
-            new_value = self.__get_value_in_units(value=new_value, unit=new_unit)
+            new_unit = other_unit
+            new_value = operation(self_value * (self_factor / other_factor), other_value)
 
-        if new_value < 0:
-            new_value = float(0)
-        
-        return (new_value, new_unit)
+        return (0.0 if new_value < 0.0 else new_value, new_unit)
     
     # dunder method for adding two Length objects, returns new Length object
     def __add__(self, other: Length) -> Length:
         new_value, new_unit = self.__addition_subtraction_helper(
-            self_value=self.value,
-            self_unit=self.unit,
-            other_value=other.value,
-            other_unit=other.unit,
+            self_value=self.__value,
+            self_unit=self.__unit,
+            other_value=other.__value,
+            other_unit=other.__unit,
             operation=operator.add
         )
-        return Length(new_value, unit=new_unit)
+        return Length._from_value(new_value, new_unit)
     
     # dunder method for subtracting two Length objects, returns new Length object
     def __sub__(self, other: Length) -> Length:
         new_value, new_unit = self.__addition_subtraction_helper(
-            self_value=self.value,
-            self_unit=self.unit,
-            other_value=other.value,
-            other_unit=other.unit,
+            self_value=self.__value,
+            self_unit=self.__unit,
+            other_value=other.__value,
+            other_unit=other.__unit,
             operation=operator.sub
         )
-        return Length(new_value, unit=new_unit)
+        return Length._from_value(new_value, new_unit)
 
     # dunder method for multiplying Length object by a factor, returns new Length object
     def __mul__(self, scalar: int | float | str) -> Length:
-        scalar = self.__get_checked_input_value(
-            value=scalar,
+        scalar = self.__get_checked_input_factor(
+            scalar=scalar,
             label="Length Multiplication Factor"
         )
-        return Length(float(self.value * scalar), unit=self.unit)
+        return Length._from_value(self.__value * scalar, self.__unit)
     
     # dunder method for dividing Length object by a factor, returns new Length object
     def __truediv__(self, scalar: int | float | str) -> Length:
-        scalar = self.__get_checked_input_value(
-            value=scalar,
+        scalar = self.__get_checked_input_factor(
+            scalar=scalar,
             label="Length Division Factor"
         )
-        return Length(float(self.value / scalar), unit=self.unit)
+        return Length._from_value(self.__value / scalar, self.__unit)
     
     # dunder method for int-dividing Length object by a factor, returns new Length object
     def __floordiv__(self, scalar: int | float | str) -> Length:
-        scalar = self.__get_checked_input_value(
-            value=scalar,
+        scalar = self.__get_checked_input_factor(
+            scalar=scalar,
             label="Length Division Factor"
         )
-        return Length(float(self.value // scalar), unit=self.unit)
+        return Length._from_value(self.__value // scalar, self.__unit)
     
+    # Length objects are mutable (see convert_to), so they are left unhashable
+    __hash__ = None
+
     # dunder method for checking if Length object is strictly shorter than other Length object
     def __lt__(self, other: Length) -> bool:
-        self_value = float(self.value * self.__CONVERSION_FACTOR[self.unit])
-        other_value = float(other.value * self.__CONVERSION_FACTOR[other.unit])
-
-        return self_value < other_value
-    
-    # dunder method for checking if Length object is shorter than or equals to other Length object
-    def __le__(self, other: Length) -> bool:
-        self_value = float(self.value * self.__CONVERSION_FACTOR[self.unit])
-        other_value = float(other.value * self.__CONVERSION_FACTOR[other.unit])
-
-        return self_value <= other_value
-    
-    # dunder method for checking if Length object is strictly greater than other Length object
-    def __gt__(self, other: Length) -> bool:
-        self_value = float(self.value * self.__CONVERSION_FACTOR[self.unit])
-        other_value = float(other.value * self.__CONVERSION_FACTOR[other.unit])
-
-        return self_value > other_value
-    
-    # dunder method for checking if Length object is greater than or equals to other Length object
-    def __ge__(self, other: Length) -> bool:
-        self_value = float(self.value * self.__CONVERSION_FACTOR[self.unit])
-        other_value = float(other.value * self.__CONVERSION_FACTOR[other.unit])
-
-        return self_value >= other_value
+        return self.__value_m < other.__value_m
     
     # dunder method for checking if Length object is equals to other Length object
     def __eq__(self, other: Length) -> bool:
-        self_value = float(self.value * self.__CONVERSION_FACTOR[self.unit])
-        other_value = float(other.value * self.__CONVERSION_FACTOR[other.unit])
+        return self.__value_m == other.__value_m
+
 
-        return self_value == other_value
\ No newline at end of file
+# module-level aliases of the class tables, so hot methods read them as globals
+# instead of resolving the mangled class attributes on every call
+_CONVERSION_FACTOR = Length._Length__CONVERSION_FACTOR
+_UNITS = Length._Length__UNITS